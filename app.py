@@ -18,8 +18,8 @@ Streamlit의 다양한 위젯들을 활용하여 실용적인 데이터 관리 
    - 페이지 새로고침 간 데이터 유지
    - 편집 모드 상태 관리
 
-4. st.cache_data로 데이터 캐싱하기
-   - 성능 최적화
+4. st.cache_resource / st.cache_data로 데이터 캐싱하기
+   - 성능 최적화 (파일 mtime 기반 캐시 무효화)
    - 데이터 재사용
 
 5. st.columns로 레이아웃 구성하기
@@ -38,12 +38,47 @@ st.set_page_config(
     initial_sidebar_state="expanded",  # 사이드바를 펼친 상태로 시작
 )
 
+import functools
+import os
+
 import pandas as pd
 from config import DATA_PATH
 
+# 컬럼명 → 한글 표시 이름 매핑
+# format_func 람다 안에서 매번 dict를 새로 만들지 않도록 모듈 레벨 상수로 정의하고,
+# get_column_config의 컬럼 제목에도 같은 매핑을 재사용합니다.
+_COL_LABELS = {
+    "Project_ID": "프로젝트 ID",
+    "Project_Name": "프로젝트명",
+    "Principal_Investigator": "책임자",
+    "Department": "부서",
+    "Start_Date": "시작일",
+    "End_Date": "종료일",
+    "Budget": "예산",
+    "Progress": "진행률",
+    "Research_Area": "연구분야",
+    "Status": "상태",
+    "Current_Phase": "현재단계",
+    "Review_Comments": "검토 의견",
+    "Action_Items": "조치 사항",
+}
+
+# category dtype으로 관리하는 저카디널리티 컬럼 (표시/필터 경로 전용)
+# categories에 없는 새 값은 categorical에 기록할 수 없으므로,
+# 편집 경로에서는 일반 문자열로 풀었다가 병합 후 다시 category로 되돌립니다.
+_CATEGORY_COLS = (
+    "Department",
+    "Status",
+    "Research_Area",
+    "Current_Phase",
+    "Principal_Investigator",
+)
+
 
 # 테이블 컬럼 설정
 # 편집 모드와 보기 모드에서 공통으로 사용할 컬럼 설정
+# 입력이 True/False 두 가지뿐이므로 lru_cache로 설정 객체를 세션당 한 번만 생성
+@functools.lru_cache(maxsize=2)
 def get_column_config(is_edit_mode=False):
     """
     테이블의 컬럼 설정을 반환합니다.
@@ -63,55 +98,55 @@ def get_column_config(is_edit_mode=False):
     """
     base_config = {
         "Project_ID": st.column_config.TextColumn(
-            "프로젝트 ID",
+            _COL_LABELS["Project_ID"],
             width="small",
             disabled=True,
         ),
         "Project_Name": st.column_config.TextColumn(
-            "프로젝트명",
+            _COL_LABELS["Project_Name"],
             width="medium",
             disabled=True,
         ),
         "Principal_Investigator": st.column_config.TextColumn(
-            "책임자",
+            _COL_LABELS["Principal_Investigator"],
             width="small",
         ),
         "Department": st.column_config.TextColumn(
-            "부서",
+            _COL_LABELS["Department"],
             width="small",
         ),
         "Start_Date": st.column_config.DateColumn(
-            "시작일",
+            _COL_LABELS["Start_Date"],
             width="small",
             format="YYYY-MM-DD",
         ),
         "End_Date": st.column_config.DateColumn(
-            "종료일",
+            _COL_LABELS["End_Date"],
             width="small",
             format="YYYY-MM-DD",
         ),
         "Budget": st.column_config.NumberColumn(
-            "예산",
+            _COL_LABELS["Budget"],
             width="small",
             format="%d원",
         ),
         "Progress": st.column_config.ProgressColumn(
-            "진행률",
+            _COL_LABELS["Progress"],
             width="small",
             min_value=0,
             max_value=100,
         ),
         "Research_Area": st.column_config.TextColumn(
-            "연구분야",
+            _COL_LABELS["Research_Area"],
             width="small",
         ),
         "Review_Comments": st.column_config.TextColumn(
-            "검토 의견",
+            _COL_LABELS["Review_Comments"],
             width="medium",
             help="프로젝트에 대한 검토 의견을 입력하세요",
         ),
         "Action_Items": st.column_config.TextColumn(
-            "조치 사항",
+            _COL_LABELS["Action_Items"],
             width="medium",
             help="필요한 조치 사항을 입력하세요",
         ),
@@ -122,12 +157,12 @@ def get_column_config(is_edit_mode=False):
         base_config.update(
             {
                 "Status": st.column_config.SelectboxColumn(
-                    "상태",
+                    _COL_LABELS["Status"],
                     width="small",
                     options=["진행중", "완료", "중단", "검토중", "준비중"],
                 ),
                 "Current_Phase": st.column_config.SelectboxColumn(
-                    "현재단계",
+                    _COL_LABELS["Current_Phase"],
                     width="small",
                     options=[
                         "계획",
@@ -145,11 +180,11 @@ def get_column_config(is_edit_mode=False):
         base_config.update(
             {
                 "Status": st.column_config.TextColumn(
-                    "상태",
+                    _COL_LABELS["Status"],
                     width="small",
                 ),
                 "Current_Phase": st.column_config.TextColumn(
-                    "현재단계",
+                    _COL_LABELS["Current_Phase"],
                     width="small",
                 ),
             }
@@ -158,30 +193,75 @@ def get_column_config(is_edit_mode=False):
     return base_config
 
 
-@st.cache_data  # 캐시 데코레이터: 동일한 입력에 대해 결과를 재사용하여 성능 향상
-def load_data():
+def _filter_options(df: pd.DataFrame, col: str) -> list:
+    """
+    사이드바 필터에 사용할 선택지 목록을 반환합니다.
+
+    category 컬럼은 미리 계산된 categories를 그대로 읽으므로 O(1)이고,
+    st.cache_data로 감싸면 캐시 키를 위해 프레임 전체를 해싱하는 비용이
+    본문보다 커서 캐싱하지 않습니다.
+
+    Args:
+        df (DataFrame): 대상 데이터프레임
+        col (str): 선택지를 뽑을 컬럼명
+
+    Returns:
+        list: "전체"를 포함한 정렬된 선택지 목록
     """
-    CSV 파일에서 데이터를 로드하고 전처리합니다.
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # astype("category")가 만든 categories는 이미 정렬된 Index — O(N) 스캔/정렬 불필요
+        return ["전체"] + s.cat.categories.tolist()
+    return ["전체"] + sorted(s.unique().tolist())
+
+
+def _current_mtime():
+    """데이터 파일의 수정 시각을 반환합니다. 파일이 없으면 0.0."""
+    try:
+        return os.path.getmtime(DATA_PATH)
+    except OSError:
+        return 0.0
+
+
+# 싱글톤 캐시: cache_data와 달리 반환값을 해싱/복사하지 않아 큰 프레임에 유리
+# 저장할 때마다 mtime 키가 바뀌므로 max_entries=1로 최신 버전만 상주시킴
+@st.cache_resource(max_entries=1)
+def load_data(mtime):
+    """
+    Parquet 파일에서 데이터를 로드하고 전처리합니다.
 
     주요 기능:
-    1. CSV 파일 읽기 (pandas 사용)
-    2. 날짜 데이터 변환 (datetime 형식으로)
-    3. 결측치 처리 (빈 문자열로 대체)
-    4. 오류 리 (파일이 없는 경우 등)
+    1. Parquet 파일 읽기 (타입이 보존되므로 날짜 변환 불필요)
+    2. 결측치 처리 (빈 문자열로 대체)
+    3. 오류 처리 (파일이 없는 경우 등)
+
+    Args:
+        mtime (float): 데이터 파일의 수정 시각. 캐시 키로만 쓰이며,
+            파일이 실제로 바뀐 경우에만 다시 읽게 합니다.
 
     Returns:
         DataFrame: 전처리된 데이터프레임
         None: 오류 발생 시
     """
     try:
-        df = pd.read_csv(DATA_PATH)
-        # 날짜 형식 컬럼 변환
-        for col in ["Start_Date", "End_Date"]:
-            df[col] = pd.to_datetime(df[col])
+        # Parquet은 datetime64 dtype을 그대로 보존하므로 to_datetime 패스가 없음
+        df = pd.read_parquet(DATA_PATH, engine="pyarrow")
+        # 외부에서 만든 파일이 날짜를 문자열로 담고 있는 경우에만 변환 (평소에는 no-op)
+        for col in ("Start_Date", "End_Date"):
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col])
         # 빈 값 처리
         df[["Review_Comments", "Action_Items"]] = df[
             ["Review_Comments", "Action_Items"]
         ].fillna("")
+        # 값 종류가 적은 문자열 컬럼은 category로 변환
+        # (필터 비교가 정수 코드 비교로 바뀌고 unique()도 사전 계산된 목록을 반환)
+        for col in _CATEGORY_COLS:
+            df[col] = df[col].astype("category")
+        # 나머지 문자열 컬럼은 Arrow 기반 string dtype으로 유지
+        # (st.dataframe이 rerun마다 직렬화할 때 셀 단위 파이썬 문자열 대신 Arrow 버퍼를 전달)
+        for col in ("Project_ID", "Project_Name", "Review_Comments", "Action_Items"):
+            df[col] = df[col].astype("string[pyarrow]")
         return df
     except Exception as e:
         st.error(f"데이터 파일을 찾을 수 없습니다: {str(e)}")
@@ -190,29 +270,54 @@ def load_data():
 
 def save_data(df):
     """
-    데이터프레임을 CSV 파일로 저장합니다.
+    데이터프레임을 Parquet 파일로 저장합니다.
 
     주요 기능:
-    1. 데이터프레임 복사 (원본 보존)
-    2. 날짜 데이터를 문자열로 변환
-    3. CSV 파일로 저장
-    4. 캐시 초기화 (새로운 데이터 반영을 위해)
-    5. 성공/실패 메시지 표시
+    1. 로드 시점 스냅샷과 비교하여 변경이 없으면 저장 생략
+    2. Parquet 파일로 저장 (dtype 보존, 날짜 문자열 변환 불필요)
+    3. 성공/실패 메시지 표시
+
+    캐시는 따로 비우지 않습니다. load_data가 파일 mtime을 캐시 키로
+    받으므로 저장 후의 rerun에서 해당 항목만 자연히 갱신됩니다.
 
     Args:
         df (DataFrame): 저장할 데이터프레임
     """
+    # 실제 변경이 없는 저장 클릭이면 디스크 쓰기를 건너뜀
+    snapshot = st.session_state.get("data_snapshot")
+    if snapshot is not None and df.equals(snapshot):
+        st.info("변경 사항이 없습니다.")
+        return
     try:
-        df_to_save = df.copy()
-        for col in ["Start_Date", "End_Date"]:
-            df_to_save[col] = df_to_save[col].dt.strftime("%Y-%m-%d")
-        df_to_save.to_csv(DATA_PATH, index=False, encoding="utf-8-sig")
+        # to_parquet은 원본을 변경하지 않으므로 복사 없이 바로 기록
+        df.to_parquet(DATA_PATH, engine="pyarrow", compression="zstd", index=False)
+        st.session_state.data_snapshot = df.copy()
         st.success("데이터가 성공적으로 저장되었습니다!")
-        st.cache_data.clear()
+        # 전역 cache clear 대신 mtime 캐시 키가 다음 rerun에서 자연스럽게 미스를 유발
     except Exception as e:
         st.error(f"저장 중 오류가 발생했습니다: {str(e)}")
 
 
+@st.cache_data  # download_button의 data 인자는 매 rerun 평가되므로 직렬화 결과를 캐싱
+def export_csv(df):
+    """
+    다운로드용 CSV 바이트를 생성합니다.
+
+    저장 포맷은 Parquet이지만, 사용자가 엑셀 등에서 열어볼 수 있도록
+    기존과 동일한 형식(utf-8-sig, YYYY-MM-DD 날짜)의 CSV 내보내기를 제공합니다.
+    데이터가 바뀌지 않은 rerun에서는 캐시된 바이트를 재사용합니다.
+
+    Args:
+        df (DataFrame): 내보낼 데이터프레임
+
+    Returns:
+        bytes: CSV 파일 내용
+    """
+    # strftime으로 셀마다 문자열을 만드는 대신 to_csv의 date_format으로 포맷 위임
+    # (to_csv는 원본을 변경하지 않으므로 사전 copy()도 불필요)
+    return df.to_csv(index=False, date_format="%Y-%m-%d").encode("utf-8-sig")
+
+
 def main():
     """
     메인 애플리케이션 로직을 구현합니다.
@@ -241,18 +346,24 @@ def main():
 
     # 세션 상태 초기화
     if "data" not in st.session_state:
-        st.session_state.data = load_data()
+        # load_data()는 세션 간 공유되는 싱글톤이므로 복사본을 세션에 보관
+        data = load_data(_current_mtime())
+        st.session_state.data = data.copy() if data is not None else None
+        # save_data에서 무변경 저장을 감지할 수 있도록 로드 시점 스냅샷 유지
+        st.session_state.data_snapshot = data.copy() if data is not None else None
     if "edit_mode" not in st.session_state:
         st.session_state.edit_mode = False
     if st.session_state.data is None:
         return
 
+    # 컬럼 Index는 세션 내에서 바뀌지 않으므로 한 번만 참조
+    # (multiselect는 시퀀스면 되므로 tolist() 변환 불필요)
+    cols = st.session_state.data.columns
+
     # 사이드바 필터 구현
     st.sidebar.header("필터")
-    departments = ["전체"] + sorted(
-        st.session_state.data["Department"].unique().tolist()
-    )
-    statuses = ["전체"] + sorted(st.session_state.data["Status"].unique().tolist())
+    departments = _filter_options(st.session_state.data, "Department")
+    statuses = _filter_options(st.session_state.data, "Status")
 
     selected_dept = st.sidebar.selectbox("부서", departments)
     selected_status = st.sidebar.selectbox("상태", statuses)
@@ -261,36 +372,31 @@ def main():
     st.sidebar.header("컬럼 설정")
     hide_columns = st.sidebar.multiselect(
         "숨길 컬럼 선택",
-        options=st.session_state.data.columns.tolist(),
+        options=cols,
         default=[],
-        format_func=lambda x: {
-            "Project_ID": "프로젝트 ID",
-            "Project_Name": "프로젝트명",
-            "Principal_Investigator": "책임자",
-            "Department": "부서",
-            "Start_Date": "시작일",
-            "End_Date": "종료일",
-            "Budget": "예산",
-            "Progress": "진행률",
-            "Research_Area": "연구분야",
-            "Status": "상태",
-            "Current_Phase": "현재단계",
-            "Review_Comments": "검토 의견",
-            "Action_Items": "조치 사항",
-        }.get(x, x),
+        format_func=lambda x: _COL_LABELS.get(x, x),
     )
 
     # 데이터 필터링
-    filtered_df = st.session_state.data.copy()
+    # 조건마다 중간 DataFrame을 만들지 않고 마스크를 합쳐 한 번의 .loc으로 슬라이스
+    # (.loc 슬라이스가 새 프레임을 돌려주므로 사전 copy()는 불필요)
+    filtered_df = st.session_state.data
+    # 숨김 컬럼 선택이 바뀐 rerun에서만 표시 컬럼 목록을 다시 계산
+    hide_key = tuple(hide_columns)
+    if st.session_state.get("_display_columns_key") != hide_key:
+        hide_set = set(hide_columns)
+        st.session_state._display_columns = [
+            col for col in cols if col not in hide_set
+        ]
+        st.session_state._display_columns_key = hide_key
+    display_columns = st.session_state._display_columns
+
+    mask = pd.Series(True, index=filtered_df.index)
     if selected_dept != "전체":
-        filtered_df = filtered_df[filtered_df["Department"] == selected_dept]
+        mask &= (filtered_df["Department"] == selected_dept).to_numpy()
     if selected_status != "전체":
-        filtered_df = filtered_df[filtered_df["Status"] == selected_status]
-
-    display_columns = [
-        col for col in st.session_state.data.columns if col not in hide_columns
-    ]
-    filtered_df = filtered_df[display_columns]
+        mask &= (filtered_df["Status"] == selected_status).to_numpy()
+    filtered_df = filtered_df.loc[mask.to_numpy(), display_columns]
 
     # 편집 모드 토글
     col1, col2, col3 = st.columns([6, 2, 2])
@@ -300,6 +406,11 @@ def main():
     # 테이블 표시
     if edit_mode:
         st.warning("⚠️ 변경사항을 저장하지 않으면 수정한 내용이 사라집니다.")
+        # 편집기에서 categories에 없는 새 값을 입력하면 categorical 셀 쓰기에서
+        # 예외가 나므로, 편집용 프레임은 해당 컬럼을 일반 문자열로 풀어서 전달
+        # (filtered_df는 .loc 슬라이스로 만든 새 프레임이라 원본에는 영향 없음)
+        edit_cat_cols = [c for c in filtered_df.columns if c in _CATEGORY_COLS]
+        filtered_df[edit_cat_cols] = filtered_df[edit_cat_cols].astype(str)
         edited_df = st.data_editor(
             filtered_df,
             column_config=get_column_config(is_edit_mode=True),
@@ -311,8 +422,18 @@ def main():
 
         with col3:
             if st.button("변경사항 저장", type="primary", use_container_width=True):
-                for idx in filtered_df.index:
-                    st.session_state.data.loc[idx] = edited_df.loc[idx]
+                # 행 단위 loop 대신 한 번의 .loc 슬라이스 할당으로 병합
+                # (숨긴 컬럼은 건드리지 않고, NA를 건너뛰는 update와 달리 지운 셀도 반영)
+                # 편집기에서 새로 추가한 행의 라벨은 원본에 없으므로 기존 행만 대상
+                rows = edited_df.index.intersection(st.session_state.data.index)
+                # 새 문자열 값을 받을 수 있도록 category를 풀고 병합한 뒤 복원
+                st.session_state.data[edit_cat_cols] = st.session_state.data[
+                    edit_cat_cols
+                ].astype(str)
+                st.session_state.data.loc[rows, edited_df.columns] = edited_df
+                st.session_state.data[edit_cat_cols] = st.session_state.data[
+                    edit_cat_cols
+                ].astype("category")
                 save_data(st.session_state.data)
                 st.session_state.edit_mode = False
                 st.rerun()
@@ -325,6 +446,16 @@ def main():
             height=500,
         )
 
+    # CSV 내보내기 (저장 포맷은 Parquet, CSV는 다운로드 용도로만 제공)
+    st.sidebar.markdown("---")
+    st.sidebar.download_button(
+        "CSV로 내보내기",
+        data=export_csv(st.session_state.data),
+        file_name="research_projects.csv",
+        mime="text/csv",
+        use_container_width=True,
+    )
+
     # 통계 정보 표시
     st.sidebar.markdown("---")
     st.sidebar.info("📊 현재 표시된 프로젝트 통계")
@@ -3,5 +3,5 @@ import os
 # 현재 파일의 디렉토리 경로
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# 데이터 파일 경로
-DATA_PATH = os.path.join(CURRENT_DIR, "research_projects.csv")
+# 데이터 파일 경로 (Parquet: 타입이 보존되는 컬럼형 포맷이라 로드 시 재파싱이 없음)
+DATA_PATH = os.path.join(CURRENT_DIR, "research_projects.parquet")
@@ -1,11 +1,14 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import datetime
 from config import DATA_PATH
 
 
 def generate_research_data(n_projects=50):
     current_date = datetime.now()
+    rng = np.random.default_rng()
 
     # 상수 정의
     INVESTIGATORS = [
@@ -43,40 +46,38 @@ def generate_research_data(n_projects=50):
     STATUSES = ["진행중", "완료", "중단", "검토중", "준비중"]
     PHASES = ["계획", "실험", "데이터수집", "분석", "검증", "논문작성", "특허출원"]
 
+    # 행 단위 np.random.choice 호출 대신 컬럼당 한 번의 벡터화된 생성으로 처리
+    # 문자열 컬럼도 np.char로 C 레벨에서 일괄 생성
+    nums = np.arange(1, n_projects + 1).astype(str)
+
+    # Parquet은 dtype을 보존하므로 날짜를 문자열이 아닌 datetime64로 유지
+    today = pd.Timestamp(current_date).normalize()
+    start_dates = today - pd.to_timedelta(rng.integers(0, 365, n_projects), unit="D")
+    end_dates = today + pd.to_timedelta(rng.integers(30, 730, n_projects), unit="D")
+
     data = {
-        "Project_ID": [f"PRJ-{str(i).zfill(3)}" for i in range(1, n_projects + 1)],
-        "Project_Name": [f"Research Project {i}" for i in range(1, n_projects + 1)],
-        "Principal_Investigator": [
-            np.random.choice(INVESTIGATORS) for _ in range(n_projects)
-        ],
-        "Department": [np.random.choice(DEPARTMENTS) for _ in range(n_projects)],
-        "Start_Date": [
-            (current_date - timedelta(days=np.random.randint(0, 365))).strftime(
-                "%Y-%m-%d"
-            )
-            for _ in range(n_projects)
-        ],
-        "End_Date": [
-            (current_date + timedelta(days=np.random.randint(30, 730))).strftime(
-                "%Y-%m-%d"
-            )
-            for _ in range(n_projects)
-        ],
-        "Budget": [np.random.randint(5000, 50000) * 10000 for _ in range(n_projects)],
-        "Progress": [np.random.randint(0, 101) for _ in range(n_projects)],
-        "Research_Area": [np.random.choice(RESEARCH_AREAS) for _ in range(n_projects)],
-        "Status": [np.random.choice(STATUSES) for _ in range(n_projects)],
-        "Current_Phase": [np.random.choice(PHASES) for _ in range(n_projects)],
+        "Project_ID": np.char.add("PRJ-", np.char.zfill(nums, 3)),
+        "Project_Name": np.char.add("Research Project ", nums),
+        "Principal_Investigator": rng.choice(INVESTIGATORS, size=n_projects),
+        "Department": rng.choice(DEPARTMENTS, size=n_projects),
+        "Start_Date": start_dates,
+        "End_Date": end_dates,
+        "Budget": rng.integers(5000, 50000, n_projects) * 10000,
+        "Progress": rng.integers(0, 101, n_projects),
+        "Research_Area": rng.choice(RESEARCH_AREAS, size=n_projects),
+        "Status": rng.choice(STATUSES, size=n_projects),
+        "Current_Phase": rng.choice(PHASES, size=n_projects),
         "Review_Comments": [""] * n_projects,
         "Action_Items": [""] * n_projects,
     }
 
-    df = pd.DataFrame(data)
+    # pandas DataFrame(BlockManager) 구성을 거치지 않고 Arrow Table로 바로 기록
+    table = pa.table(data)
 
     try:
-        df.to_csv(DATA_PATH, index=False, encoding="utf-8-sig")
+        pq.write_table(table, DATA_PATH, compression="zstd")
         print(f"데이터가 성공적으로 생성되었습니다: {DATA_PATH}")
-        return df
+        return table.to_pandas()
     except Exception as e:
         print(f"데이터 저장 중 오류가 발생했습니다: {str(e)}")
         return None